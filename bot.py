@@ -3,8 +3,12 @@ import subprocess
 import threading
 import time
 import os
-from collections import Counter, defaultdict
+import queue
+import sys
+import selectors
+from collections import Counter, OrderedDict, deque
 import configparser
+import logging
 
 config = configparser.ConfigParser()
 config.read("settings.txt")
@@ -20,13 +24,77 @@ BUFFERLENGTH = int(settings["BUFFERLENGTH"])
 ACTIVE_DECAY = int(settings["ACTIVE_DECAY"])
 MAJORITY_RATIO = float(settings["MAJORITY_RATIO"])
 
-def debug_print(msg):
-    if DEBUG:
-        print("[DEBUG]" + msg)
+# All diagnostics go through logging; debug messages are only formatted when DEBUG is on
+logging.basicConfig(format="[%(levelname)s] %(message)s")
+log = logging.getLogger("informbot")
+log.setLevel(logging.DEBUG if DEBUG else logging.WARNING)
+
+class TokenBucket:
+    """Rate limiter for messages sent to IRC: `rate` lines per second, bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+
+    def consume(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens < 1:
+            wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+            self.last += wait
+            self.tokens = 1
+        self.tokens -= 1
+
+class VoteTally(Counter):
+    """Vote counts that keep track of the leading entry as votes come and go.
+
+    Ties go to the entry that entered the tally first, the same rule as
+    most_common(), whichever way the tie came about.
+
+    `summary` caches the formatted status line and is reset on every change.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.top = (None, 0)
+        self.summary = None
+
+    def add(self, key):
+        self.summary = None
+        self[key] += 1
+        top_key, top_votes = self.top
+        if self[key] > top_votes or (self[key] == top_votes and self._precedes(key, top_key)):
+            self.top = (key, self[key])
+
+    def _precedes(self, key, other):
+        # Only walked on a tie with the leader; stops at whichever comes first
+        for k in self:
+            if k == key:
+                return k != other
+            if k == other:
+                return False
+
+    def remove(self, key):
+        self.summary = None
+        self[key] -= 1
+        if self[key] <= 0:
+            del self[key]
+        if key == self.top[0]:
+            # The leader lost a vote; recount once to find the new one
+            self.top = self.most_common(1)[0] if self else (None, 0)
+
+    def clear(self):
+        super().clear()
+        self.top = (None, 0)
+        self.summary = None
 
 class InformGame:
     def __init__(self, game_path):
-        debug_print(f"Starting game with path: {game_path}")
+        log.debug("Starting game with path: %s", game_path)
         self.process = subprocess.Popen(
             ["stdbuf", "-oL", "dfrotz", "-m", game_path],
             stdin=subprocess.PIPE,
@@ -35,14 +103,48 @@ class InformGame:
             text=True,
             bufsize=1
         )
+        # Game output is read straight from the pipe without blocking; the
+        # selector wakes us only when there is data or the game has exited
+        self.stdout_fd = self.process.stdout.fileno()
+        os.set_blocking(self.stdout_fd, False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.stdout_fd, selectors.EVENT_READ)
+        self._pending = bytearray()
+
+    def read_lines(self, timeout=None):
+        """Return completed output lines, [] if none arrived within timeout, or None once the game has exited.
+
+        Output left without a trailing newline at exit is returned as a final line first.
+        """
+        if not self.selector.select(timeout):
+            if self.process.poll() is None:
+                return []
+            return self._finish()
+        try:
+            chunk = os.read(self.stdout_fd, 4096)
+        except BlockingIOError:
+            return []
+        if not chunk:
+            return self._finish()
+        self._pending += chunk
+        *lines, self._pending = self._pending.split(b"\n")
+        return [line.decode(errors="replace").rstrip("\r") for line in lines]
+
+    def _finish(self):
+        if self._pending:
+            last = self._pending.decode(errors="replace").rstrip("\r")
+            self._pending = bytearray()
+            return [last]
+        self.selector.close()
+        return None
 
     def send_command(self, command):
-        debug_print(f"Sending command to game: {command}")
+        log.debug("Sending command to game: %s", command)
         self.process.stdin.write(command + "\n")
         self.process.stdin.flush()
 
     def stop(self):
-        debug_print("Stopping game process")
+        log.debug("Stopping game process")
         if self.process.poll() is None:
             self.process.terminate()
             self.process.wait()
@@ -57,36 +159,57 @@ class InformBot:
         self.users_in_channel = set()
         
         self.voter_choices = {}  # user -> command
-        self.votes = defaultdict(set)  # command -> set of users
+        self.vote_tally = VoteTally()  # command -> number of votes
 
-        self.game_votes = defaultdict(set)    # game -> set of users
         self.game_voter_choices = {}          # user -> game
+        self.game_tally = VoteTally()         # game -> number of votes
 
         self.stopgame_voters = set()
-        self.replay_buffer = []
-        self.required_votes = 1
-        self.users_last_activity = {}  # dict: nick -> last message timestamp
+        self._games_cache = (0, frozenset(), [])  # (GAME_DIR mtime, name set, name list)
+        self.replay_buffer = deque(maxlen=BUFFERLENGTH)
+        self.send_bucket = TokenBucket(rate=2.0, capacity=4)
+        self._out_queue = queue.Queue()  # channel messages waiting for _send_loop
+        self._required_votes_cache = None  # reset whenever the active user set changes
+        self.users_last_activity = OrderedDict()  # nick -> last message timestamp, oldest first
         self.command_vote_start = None
         self.load_vote_start = None
         self.stopgame_vote_start = None
-
-    def get_active_user_count(self):
-        now = time.time()
+        self._wake = threading.Event()  # set when a new voting round starts
+
+        # Keys are interned so lookups with an interned token hit the identity fast path
+        self._dispatch = {sys.intern(k): v for k, v in {
+            "!games": self._cmd_games,
+            "!load": self._cmd_load,
+            "!vote": self._cmd_vote,
+            "!stopgame": self._cmd_stopgame,
+            "!replay": self._cmd_replay,
+            "!status": self._cmd_status,
+            "!help": self._cmd_help,
+        }.items()}
+
+    def _prune_inactive(self, now):
         cutoff = now - ACTIVE_DECAY
-        # Remove inactive users
-        inactive = [user for user, ts in self.users_last_activity.items() if ts < cutoff]
-        for user in inactive:
-            del self.users_last_activity[user]
+        activity = self.users_last_activity
+        # Remove inactive users; entries are kept in order of last activity
+        while activity and next(iter(activity.values())) < cutoff:
+            activity.popitem(last=False)
+            self._required_votes_cache = None
+
+    def get_active_user_count(self, now):
+        self._prune_inactive(now)
+        activity = self.users_last_activity
         # Optionally exclude the bot itself
-        active_users = [u for u in self.users_last_activity if u != BOT_NICK]
-        return len(active_users)
+        return len(activity) - (1 if BOT_NICK in activity else 0)
 
-    def get_required_votes(self):
-        active_count = self.get_active_user_count()
-        return max(1, int(active_count * MAJORITY_RATIO) + 1)
+    def get_required_votes(self, now):
+        # Pruning here is what invalidates the cache when users go inactive
+        active_count = self.get_active_user_count(now)
+        if self._required_votes_cache is None:
+            self._required_votes_cache = max(1, int(active_count * MAJORITY_RATIO) + 1)
+        return self._required_votes_cache
 
-    def _handle_status(self):
-        required_votes = self.get_required_votes()
+    def _handle_status(self, now):
+        required_votes = self.get_required_votes(now)
         game_status = f"Active game: {self.gamename}" if self.game else "No game loaded."
         settings = (
             f"{game_status} | "
@@ -94,13 +217,13 @@ class InformBot:
             f"Majority threshold: {required_votes} votes | "
             f"Replay buffer size: {len(self.replay_buffer)}/{BUFFERLENGTH}"
         )
-        self.client.privmsg(CHANNEL, settings)
+        self.say(settings)
 
     def connect(self):
         try:
             self.client.connect(SERVER, PORT, BOT_NICK)
         except irc.client.ServerConnectionError as e:
-            print(f"[ERROR] Connection failed: {e}")
+            log.error("Connection failed: %s", e)
             return
 
         self.client.add_global_handler("welcome", self.on_connect)
@@ -112,187 +235,223 @@ class InformBot:
         self.client.add_global_handler("kick", self.on_kick)
         self.client.add_global_handler("ping", lambda conn, event: conn.pong(event.target))
         threading.Thread(target=self._vote_loop, daemon=True).start()
+        threading.Thread(target=self._send_loop, daemon=True).start()
         self.reactor.process_forever()
 
+    def say(self, msg):
+        self._out_queue.put(msg)
+
+    def _send_loop(self):
+        # Single sender so all channel output shares one flood limit
+        while True:
+            msg = self._out_queue.get()
+            self.send_bucket.consume()
+            try:
+                self.client.privmsg(CHANNEL, msg)
+            except irc.client.ServerNotConnectedError:
+                log.debug("Not connected, dropping message: %s", msg)
+            except Exception:
+                # e.g. MessageTooLong or InvalidCharacters; never let one bad line kill the sender
+                log.exception("Failed to send message: %r", msg)
+
     def on_connect(self, conn, event):
-        debug_print(f"Connected to {SERVER}, joining {CHANNEL}")
+        log.debug("Connected to %s, joining %s", SERVER, CHANNEL)
         conn.join(CHANNEL)
 
     def on_kick(self, conn, event):
         nick = event.arguments[0]
         self.users_in_channel.discard(nick)
-        debug_print(f"{nick} was kicked from {CHANNEL}")
+        log.debug("%s was kicked from %s", nick, CHANNEL)
 
     def on_pubmsg(self, conn, event):
         msg = event.arguments[0].strip()
         user = event.source.nick
-        now = time.time()
+        now = time.monotonic()
+        # Re-inserting moves the user to the newest end of the activity order
+        if self.users_last_activity.pop(user, None) is None:
+            self._required_votes_cache = None
         self.users_last_activity[user] = now
-        debug_print(f"Received message from {user}: {msg}")
-
-        if msg.lower() == "!games":
-            games = self.list_games()
-            debug_print(f"Listing games: {games}")
-            conn.privmsg(CHANNEL, "Available games: " + ", ".join(games) if games else "No games found.")
-
-        elif msg.lower().startswith("!load "):
-            game_name = msg[6:].strip()
-            if game_name in self.list_games():
-
-                if user in self.game_voter_choices:
-                    old_game = self.game_voter_choices[user]
-                    self.game_votes[old_game].discard(user)
-
-                # Add new vote
-                self.game_voter_choices[user] = game_name
-                self.game_votes[game_name].add(user)
-                if not self.load_vote_start:
-                    self.load_vote_start = time.time()
-            else:
-                conn.privmsg(CHANNEL, f"{user}: game '{game_name}' not found.")
-
-        elif msg.lower().startswith("!vote"):
-                cmd = msg[5:].strip()
-
-                if not cmd:
-                    status_msgs = []
-
-                    if self.game_votes:
-                        game_vote_counts = Counter({g: len(users) for g, users in self.game_votes.items() if len(users) > 0})
-                        parts = [f"{g}: {c} vote{'s' if c != 1 else ''}" for g, c in game_vote_counts.items()]
-                        status_msgs.append("Load votes: " + ", ".join(parts))
-                        if self.load_vote_start:
-                            time_elapsed = now - self.load_vote_start
-                            time_remaining = max(0, int(VOTE_INTERVAL - time_elapsed))
-                            status_msgs.append(f"!! {time_remaining} second{'s' if time_remaining != 1 else ''} left to vote. !!")
-
-                    if self.votes:
-                        cmd_vote_counts = Counter({c: len(users) for c, users in self.votes.items() if len(users) > 0})
-                        parts = [f"'{c}': {v} vote{'s' if v != 1 else ''}" for c, v in cmd_vote_counts.items()]
-                        status_msgs.append("Command votes: " + ", ".join(parts))
-                        if self.command_vote_start:
-                            time_elapsed = now - self.command_vote_start
-                            time_remaining = int(VOTE_INTERVAL - time_elapsed)
-                            status_msgs.append(f"!! {time_remaining} second{'s' if time_remaining != 1 else ''} left to vote. !!")
-
-                    if status_msgs:
-                        for line in status_msgs:
-                            conn.privmsg(CHANNEL, line)
-                    else:
-                        conn.privmsg(CHANNEL, "No active votes currently.")
-                    return
-
-                if self.game is None:
-                    conn.privmsg(CHANNEL, "No game loaded. Vote to load a game first using: !load <gamefile>")
-                    return
-
-                # Remove old vote if they voted before
-                if user in self.voter_choices:
-                    old_cmd = self.voter_choices[user]
-                    self.votes[old_cmd].discard(user)
-
-                # Register new vote
-                self.voter_choices[user] = cmd
-                self.votes[cmd].add(user)
-
-                if not self.command_vote_start:
-                    self.command_vote_start = time.time()
-                
-        elif msg.lower() == "!stopgame":
-            if not self.game:
-                conn.privmsg(CHANNEL, "No game is currently running.")
-                return
-
-            if user not in self.stopgame_voters:
-                self.stopgame_voters.add(user)
-                if not self.stopgame_vote_start:
-                    self.stopgame_vote_start = time.time()
-            else:
-                conn.privmsg(CHANNEL, f"{user}: you already voted to stop the game this round.")
-
-        elif msg.lower() == "!replay":
-            if self.replay_buffer:
-                debug_print(f"Replaying last {len(self.replay_buffer)} lines")
-                for replay_line in self.replay_buffer:
-                    conn.privmsg(CHANNEL, replay_line)
-                    time.sleep(1) 
+        # Most channel chatter is not a bot command; skip it as cheaply as possible
+        if not msg.startswith("!"):
+            return
+        log.debug("Received command from %s: %s", user, msg)
+
+        head = sys.intern(msg.lower().partition(" ")[0])
+        handler = self._dispatch.get(head)
+        if handler:
+            handler(conn, user, msg[len(head):].strip(), now)
+
+    def _cmd_games(self, conn, user, arg, now):
+        games = self.list_games()
+        log.debug("Listing games: %s", games)
+        self.say("Available games: " + ", ".join(games) if games else "No games found.")
+
+    def _cmd_load(self, conn, user, arg, now):
+        game_name = arg
+        if not game_name:
+            return
+        self.list_games()
+        if game_name in self._games_cache[1]:
+
+            old_game = self.game_voter_choices.get(user)
+            if old_game is not None:
+                self.game_tally.remove(old_game)
+
+            # Add new vote
+            self.game_voter_choices[user] = game_name
+            self.game_tally.add(game_name)
+            if not self.load_vote_start:
+                self.load_vote_start = now
+                self._wake.set()
+        else:
+            self.say(f"{user}: game '{game_name}' not found.")
+
+    def _cmd_vote(self, conn, user, arg, now):
+        cmd = arg
+
+        if not cmd:
+            status_msgs = []
+
+            if self.game_tally:
+                if self.game_tally.summary is None:
+                    parts = [f"{g}: {c} vote{'s' if c != 1 else ''}" for g, c in self.game_tally.items()]
+                    self.game_tally.summary = "Load votes: " + ", ".join(parts)
+                status_msgs.append(self.game_tally.summary)
+                if self.load_vote_start:
+                    time_elapsed = now - self.load_vote_start
+                    time_remaining = max(0, int(VOTE_INTERVAL - time_elapsed))
+                    status_msgs.append(f"!! {time_remaining} second{'s' if time_remaining != 1 else ''} left to vote. !!")
+
+            if self.vote_tally:
+                if self.vote_tally.summary is None:
+                    parts = [f"'{c}': {v} vote{'s' if v != 1 else ''}" for c, v in self.vote_tally.items()]
+                    self.vote_tally.summary = "Command votes: " + ", ".join(parts)
+                status_msgs.append(self.vote_tally.summary)
+                if self.command_vote_start:
+                    time_elapsed = now - self.command_vote_start
+                    time_remaining = int(VOTE_INTERVAL - time_elapsed)
+                    status_msgs.append(f"!! {time_remaining} second{'s' if time_remaining != 1 else ''} left to vote. !!")
+
+            if status_msgs:
+                for line in status_msgs:
+                    self.say(line)
             else:
-                conn.privmsg(CHANNEL, "No lines to replay yet.")
+                self.say("No active votes currently.")
+            return
 
-        elif msg.lower() == "!status":
-            self._handle_status()
+        if self.game is None:
+            self.say("No game loaded. Vote to load a game first using: !load <gamefile>")
+            return
+
+        # Remove old vote if they voted before
+        old_cmd = self.voter_choices.get(user)
+        if old_cmd is not None:
+            self.vote_tally.remove(old_cmd)
+
+        # Register new vote
+        self.voter_choices[user] = cmd
+        self.vote_tally.add(cmd)
+
+        if not self.command_vote_start:
+            self.command_vote_start = now
+            self._wake.set()
 
-        elif msg.lower() == "!help":
-            conn.privmsg(CHANNEL, "Commands: !games, !load <gamefile>, !vote <command>, !stopgame, !replay, !status")
+    def _cmd_stopgame(self, conn, user, arg, now):
+        if not self.game:
+            self.say("No game is currently running.")
+            return
+
+        if user not in self.stopgame_voters:
+            self.stopgame_voters.add(user)
+            if not self.stopgame_vote_start:
+                self.stopgame_vote_start = now
+                self._wake.set()
+        else:
+            self.say(f"{user}: you already voted to stop the game this round.")
+
+    def _cmd_replay(self, conn, user, arg, now):
+        if self.replay_buffer:
+            log.debug("Replaying last %s lines", len(self.replay_buffer))
+            # Snapshot the buffer; the relay thread may append while we queue
+            for replay_line in list(self.replay_buffer):
+                self.say(replay_line)
+        else:
+            self.say("No lines to replay yet.")
+
+    def _cmd_status(self, conn, user, arg, now):
+        self._handle_status(now)
+
+    def _cmd_help(self, conn, user, arg, now):
+        self.say("Commands: !games, !load <gamefile>, !vote <command>, !stopgame, !replay, !status")
 
     def on_names(self, conn, event):
         if event.arguments[1] == CHANNEL:
-            raw_users = event.arguments[2].split()
-            clean_users = set()
-            for nick in raw_users:
-                # Strip IRC prefixes like @, +, etc.
-                while nick and nick[0] in ('@', '+', '%', '&', '~'):
-                    nick = nick[1:]
-                if nick != BOT_NICK:
-                    clean_users.add(nick)
+            # Strip IRC prefixes like @, +, etc.
+            clean_users = {nick.lstrip("@+%&~") for nick in event.arguments[2].split()}
+            clean_users.discard(BOT_NICK)
             self.users_in_channel = clean_users
-            debug_print(f"Names in channel (cleaned): {self.users_in_channel}")
+            log.debug("Names in channel (cleaned): %s", self.users_in_channel)
 
     def on_join(self, conn, event):
         if event.target == CHANNEL:
             nick = event.source.nick
             if nick != BOT_NICK:
                 self.users_in_channel.add(nick)
-                debug_print(f"{nick} joined {CHANNEL}")
+                log.debug("%s joined %s", nick, CHANNEL)
 
     def on_part(self, conn, event):
         if event.target == CHANNEL:
             nick = event.source.nick
             self.users_in_channel.discard(nick)
-            debug_print(f"{nick} left {CHANNEL}")
+            log.debug("%s left %s", nick, CHANNEL)
 
     def on_quit(self, conn, event):
         nick = event.source.nick
         self.users_in_channel.discard(nick)
-        debug_print(f"{nick} quit")
+        log.debug("%s quit", nick)
 
     def list_games(self):
         try:
-            games = [f for f in os.listdir(GAME_DIR)]
-            debug_print(f"Found games in directory: {games}")
-            return games
+            mtime = os.stat(GAME_DIR).st_mtime_ns
+            if mtime != self._games_cache[0]:
+                games = os.listdir(GAME_DIR)
+                self._games_cache = (mtime, frozenset(games), games)
+                log.debug("Found games in directory: %s", games)
+            return self._games_cache[2]
         except:
-            print("[ERROR] Game directory not found.")
+            log.error("Game directory not found.")
+            self._games_cache = (0, frozenset(), [])
             return []
 
     def _vote_loop(self):
         while True:
-            time.sleep(1)
-            now = time.time()
-            debug_print(f"Vote loop triggered. Game loaded: {self.game is not None}")
-            debug_print(f"Users online: {len(self.users_in_channel)}")
-            active_count = self.get_active_user_count()
-            debug_print(f"Active users: {active_count}")
-            required_votes = self.get_required_votes()
+            # Sleep until the earliest running round ends, or until one starts
+            self._wake.clear()
+            starts = [t for t in (self.load_vote_start, self.command_vote_start, self.stopgame_vote_start) if t]
+            timeout = max(0, min(starts) + VOTE_INTERVAL - time.monotonic()) if starts else None
+            self._wake.wait(timeout)
+            now = time.monotonic()
+            log.debug("Vote loop triggered. Game loaded: %s", self.game is not None)
+            log.debug("Users online: %s", len(self.users_in_channel))
+            required_votes = self.get_required_votes(now)
+            log.debug("Active users: %s", len(self.users_last_activity) - (BOT_NICK in self.users_last_activity))
 
             if self.load_vote_start and (now - self.load_vote_start >= VOTE_INTERVAL):
-                if self.game_votes:
-                    vote_counts = Counter({g: len(users) for g, users in self.game_votes.items()})
-                    debug_print(f"Game load votes: {dict(vote_counts)}")
-                    top_game, top_votes = vote_counts.most_common(1)[0]
+                if self.game_tally:
+                    log.debug("Game load votes: %r", self.game_tally)
+                    top_game, top_votes = self.game_tally.top
                     if top_votes >= required_votes:
                         self.load_game(top_game)
-                        self.client.privmsg(CHANNEL, f"Loading game: {top_game}")
                     else:
-                        self.client.privmsg(CHANNEL, f"No majority to load game. Votes cleared.")
-                        debug_print(f"Load game votes: {top_votes} / {required_votes}")
-                    self.game_votes.clear()
+                        self.say(f"No majority to load game. Votes cleared.")
+                        log.debug("Load game votes: %s / %s", top_votes, required_votes)
                     self.game_voter_choices.clear()
-                    self.votes.clear()
+                    self.game_tally.clear()
                     self.voter_choices.clear()
+                    self.vote_tally.clear()
                     self.stopgame_voters.clear()
-                    self.load_vote_start = None
-                    continue
+                self.load_vote_start = None
+                continue
 
             if self.stopgame_vote_start and (now - self.stopgame_vote_start >= VOTE_INTERVAL):
                 if self.game and self.stopgame_voters:
@@ -300,80 +459,79 @@ class InformBot:
                     if stop_votes >= required_votes:
                         self.game.stop()
                         self.game = None
-                        self.client.privmsg(CHANNEL, "Game stopped by vote.")
+                        self.say("Game stopped by vote.")
                     else:
-                        self.client.privmsg(CHANNEL, "No majority to stop game. Votes cleared.")
-                        debug_print(f"Stop game votes: {stop_votes} / {required_votes}")
-                    self.votes.clear()
+                        self.say("No majority to stop game. Votes cleared.")
+                        log.debug("Stop game votes: %s / %s", stop_votes, required_votes)
                     self.voter_choices.clear()
-                    self.game_votes.clear()
+                    self.vote_tally.clear()
                     self.game_voter_choices.clear()
+                    self.game_tally.clear()
                     self.stopgame_voters.clear()
-                    self.stopgame_vote_start = None
-                    continue
+                self.stopgame_vote_start = None
+                continue
 
             if self.game is None:
-                self.votes.clear()
                 self.voter_choices.clear()
+                self.vote_tally.clear()
+                self.command_vote_start = None
                 continue
 
             if self.command_vote_start and (now - self.command_vote_start >= VOTE_INTERVAL):
-                if self.votes:
-                    vote_counts = Counter({cmd: len(users) for cmd, users in self.votes.items()})
-                    debug_print(f"Command votes: {dict(vote_counts)}")
-                    top_cmd, top_votes = vote_counts.most_common(1)[0]
+                if self.vote_tally:
+                    log.debug("Command votes: %r", self.vote_tally)
+                    top_cmd, top_votes = self.vote_tally.top
                     if top_votes >= required_votes:
                         self.game.send_command(top_cmd)
-                        self.client.privmsg(CHANNEL, f"> {top_cmd}")
+                        self.say(f"> {top_cmd}")
                     else:
-                        self.client.privmsg(CHANNEL, "No majority for command. Votes cleared.")
-                        debug_print(f"Command votes: {top_votes} / {required_votes}")
-                    self.votes.clear()
+                        self.say("No majority for command. Votes cleared.")
+                        log.debug("Command votes: %s / %s", top_votes, required_votes)
                     self.voter_choices.clear()
-                    self.command_vote_start = None
+                    self.vote_tally.clear()
+                self.command_vote_start = None
 
 
     def load_game(self, gamefile):
         if self.game:
             self.game.stop()
-            self.client.privmsg(CHANNEL, "Previous game stopped.")
+            self.say("Previous game stopped.")
 
         path = os.path.join(GAME_DIR, gamefile)
-        debug_print(f"Loading game from: {path}")
+        log.debug("Loading game from: %s", path)
         self.game = InformGame(path)
-        time.sleep(0.5)
+        # Announce before the relay starts so the game's opening text follows it
+        self.say(f"Loading game: {gamefile}")
         threading.Thread(target=self._relay_game_output, daemon=True).start()
 
     def _relay_game_output(self):
         first_line_set = False
         game_name_counter=0
-        while self.game and self.game.process.poll() is None:
+        game = self.game
+        while self.game is game:
             try:
-                line = self.game.process.stdout.readline()
-                if line == '':
-                    time.sleep(0.1)
-                    continue
+                lines = game.read_lines(timeout=1.0)
+                if lines is None:
+                    break
 
-                line = line.rstrip('\r\n')
-                if line:
+                for line in lines:
+                    if not line:
+                        continue
                     if not first_line_set:
                         game_name_counter+=1
                         if game_name_counter==3:
                             self.gamename = line
                             first_line_set = True
-                            debug_print(f"Game name set to: '{self.gamename}'")
-                    debug_print(f"Sending line to IRC: '{line}'")
-                    self.client.privmsg(CHANNEL, line)
+                            log.debug("Game name set to: '%s'", self.gamename)
+                    log.debug("Sending line to IRC: '%s'", line)
+                    self.say(line)
                     self.replay_buffer.append(line)
-                    if len(self.replay_buffer) > BUFFERLENGTH:
-                        self.replay_buffer.pop(0)
-                    time.sleep(1)
 
-            except Exception as e:
-                debug_print(f"[ERROR] Reading game output: {e}")
+            except Exception:
+                log.exception("Error reading game output")
                 break
 
 if __name__ == "__main__":
-    debug_print("[DEBUG] Starting InformBot...")
+    log.debug("Starting InformBot...")
     bot = InformBot()
     bot.connect()